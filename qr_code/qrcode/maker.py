@@ -2,7 +2,10 @@
 import base64
 import hashlib
 import io
-from typing import Mapping, Any
+import logging
+import threading
+from collections import OrderedDict
+from typing import Mapping, Any, Hashable, Optional
 
 from django.conf import settings
 from django.core.cache import caches
@@ -17,6 +20,90 @@ from qr_code.qrcode.constants import DEFAULT_CACHE_ENABLED, DEFAULT_URL_SIGNATUR
 from qr_code.qrcode.serve import make_qr_code_url
 from qr_code.qrcode.utils import QRCodeOptions
 
+logger = logging.getLogger(__name__)
+
+
+class _LRUCache:
+    """A small thread-safe in-process LRU cache whose capacity is read from a Django setting at each access.
+
+    Setting the capacity to 0 disables the cache.
+    """
+
+    def __init__(self, setting_name: str, default_size: int) -> None:
+        self._setting_name = setting_name
+        self._default_size = default_size
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def max_size(self) -> int:
+        return getattr(settings, self._setting_name, self._default_size)
+
+    def get(self, key: Optional[Hashable]) -> Any:
+        if key is None or self.max_size() <= 0:
+            return None
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                logger.debug("%s cache miss (%d entries).", self._setting_name, len(self._entries))
+                return None
+            logger.debug("%s cache hit (%d entries).", self._setting_name, len(self._entries))
+            return self._entries[key]
+
+    def set(self, key: Optional[Hashable], value: Any) -> None:
+        max_size = self.max_size()
+        if key is None or max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_QR_IMAGE_CACHE = _LRUCache("QR_CODE_IMAGE_CACHE_SIZE", 128)
+_EMBEDDED_QR_CODE_CACHE = _LRUCache("QR_CODE_EMBED_CACHE_SIZE", 256)
+
+
+def _make_cache_key(data: Any, qr_code_options: QRCodeOptions, force_text: bool, *args: Any) -> Optional[Hashable]:
+    """Returns a key identifying the QR code built from the given arguments, or `None` if `data` cannot be hashed.
+
+    When `force_text` is set, `data` must already have been converted with `_as_text`.
+    """
+    key = (type(data), data, force_text, qr_code_options.cache_key(), *args)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+_thread_local = threading.local()
+
+
+def _get_reusable_stream() -> io.BytesIO:
+    """Returns a rewound BytesIO buffer owned by the current thread, to serialize QR codes without reallocating a buffer
+    for each image.
+
+    The buffer is deliberately not truncated since truncating a BytesIO releases its memory. Only its first `tell()`
+    bytes hold what has been written since the call.
+    """
+    stream = getattr(_thread_local, "stream", None)
+    if stream is None:
+        stream = _thread_local.stream = io.BytesIO()
+    stream.seek(0)
+    return stream
+
+
+def _as_text(data: Any, force_text: bool) -> Any:
+    """Converts `data` to a string once when `force_text` is set, so that lazy strings and other objects are not
+    evaluated again for the cache key, the encoder and the alternative text."""
+    return str(data) if force_text else data
+
 
 @validate_call(config=PYDANTIC_CONFIG)
 def make_qr(data: Any, qr_code_options: QRCodeOptions, force_text: bool = True):
@@ -39,15 +126,25 @@ def make_qr_code_image(data: Any, qr_code_options: QRCodeOptions, force_text: bo
     """
     Creates a bytes object representing a QR code image for the provided `data`.
 
+    The generated images are kept in a bounded in-process LRU cache whose capacity is given by the
+    `QR_CODE_IMAGE_CACHE_SIZE` setting (default: 128, 0 disables the cache).
+
     :param str data: The data to encode
     :param qr_code_options: Options to create and serialize the QR code.
     :param bool force_text: Tells whether we want to force the `data` to be considered as text string and encoded in byte mode.
     :rtype: bytes
     """
-    qr = make_qr(data, qr_code_options, force_text=force_text)
-    out = io.BytesIO()
-    qr.save(out, **qr_code_options.kw_save())
-    return out.getvalue()
+    data = _as_text(data, force_text)
+    key = _make_cache_key(data, qr_code_options, force_text)
+    image = _QR_IMAGE_CACHE.get(key)
+    if image is None:
+        qr = make_qr(data, qr_code_options, force_text=force_text)
+        out = _get_reusable_stream()
+        qr.save(out, **qr_code_options.kw_save())
+        with out.getbuffer() as buffer:
+            image = bytes(buffer[: out.tell()])
+        _QR_IMAGE_CACHE.set(key, image)
+    return image
 
 
 @validate_call(config=PYDANTIC_CONFIG)
@@ -103,12 +200,30 @@ def make_embedded_qr_code(
     -----
     * The returned fragment is ready to insert into any HTML document.
     * All text is HTML-escaped to prevent injection.
+    * The generated fragments are kept in a bounded in-process LRU cache whose capacity is given by the
+      `QR_CODE_EMBED_CACHE_SIZE` setting (default: 256, 0 disables the cache).
 """
+    data = _as_text(data, force_text)
+    key = _make_cache_key(data, qr_code_options, force_text, use_data_uri_for_svg, alt_text, class_names)
+    html = _EMBEDDED_QR_CODE_CACHE.get(key)
+    if html is None:
+        html = _make_embedded_qr_code(data, qr_code_options, force_text, use_data_uri_for_svg, alt_text, class_names)
+        _EMBEDDED_QR_CODE_CACHE.set(key, html)
+    return html
 
+
+def _make_embedded_qr_code(
+    data: Any,
+    qr_code_options: QRCodeOptions,
+    force_text: bool,
+    use_data_uri_for_svg: bool,
+    alt_text: None | str,
+    class_names: None | str,
+) -> str:
+    """Builds the HTML fragment returned by `make_embedded_qr_code`, bypassing the in-process cache."""
     qr = make_qr(data, qr_code_options, force_text=force_text)
     kw = qr_code_options.kw_save()
-    # Pop the image format from the keywords since qr.png_data_uri / qr.svg_inline
-    # set it automatically
+    # Pop the image format from the keywords since it is given explicitly when saving
     kw.pop("kind")
     if alt_text is None and (use_data_uri_for_svg or qr_code_options.image_format == "png"):
         if isinstance(data, bytes):
@@ -136,17 +251,28 @@ def make_embedded_qr_code(
         class_attr = ""
 
     if qr_code_options.image_format == "png":
-        return mark_safe(f'<img src="{qr.png_data_uri(**kw)}" alt="{escape(alt_text)}"{class_attr}>')
+        png_b64_data = _make_base64_image_data(qr, "png", kw)
+        return mark_safe(f'<img src="data:image/png;base64,{png_b64_data}" alt="{escape(alt_text)}"{class_attr}>')
 
     if use_data_uri_for_svg:
-        out = io.BytesIO()
-        qr.save(out, **qr_code_options.kw_save())
-        svg_path = out.getvalue()
-        svg_b64_data = base64.b64encode(svg_path).decode("utf-8")
+        svg_b64_data = _make_base64_image_data(qr, "svg", kw)
         html = f'<img src="data:image/svg+xml;base64,{svg_b64_data}" alt="{escape(alt_text)}"{class_attr}>'
         return mark_safe(html)
     else:
-        return mark_safe(qr.svg_inline(**kw))
+        # Same as qr.svg_inline(**kw), but serialized into the reusable stream and decoded straight from it.
+        out = _get_reusable_stream()
+        qr.save(out, kind="svg", xmldecl=False, svgns=False, nl=False, **kw)
+        with out.getbuffer() as buffer:
+            return mark_safe(str(buffer[: out.tell()], encoding="utf-8"))
+
+
+def _make_base64_image_data(qr: segno.QRCode, kind: str, kw: dict) -> str:
+    """Serializes the QR code into the given image format and returns the image encoded in Base64."""
+    out = _get_reusable_stream()
+    qr.save(out, kind=kind, **kw)
+    # Encode the buffer in place rather than copying it out with getvalue(); base64 output is pure ASCII.
+    with out.getbuffer() as buffer:
+        return base64.b64encode(buffer[: out.tell()]).decode("ascii")
 
 
 def get_or_make_cached_embedded_qr_code(
@@ -160,6 +286,8 @@ def get_or_make_cached_embedded_qr_code(
     """
     Same as `make_embedded_qr_code`but caches the result the first time is it called for a given set of args and returned the cached result. It raises an exception when the `QR_CODE_CACHE_ALIAS` setting is not set.
 
+    The result is shared with other processes through the `QR_CODE_CACHE_ALIAS` cache, and is also kept in the in-process cache of `make_embedded_qr_code`, which is looked up first.
+
     :param data: See `make_embedded_qr_code`.
     :param qr_code_options: See `make_embedded_qr_code`.
     :param force_text: See `make_embedded_qr_code`.
@@ -173,11 +301,15 @@ def get_or_make_cached_embedded_qr_code(
     if not cache_name:
         raise RuntimeError(f"QR_CODE_CACHE_ALIAS must be set in settings.")
 
-    url = make_qr_code_url(data=data, qr_code_options=qr_code_options, force_text=force_text, cache_enabled=True, url_signature_enabled=False)
-    # To simplify the logic, use the QR URL without a signature as the base for the cache key, and append the
-    # data_uri_for_svg value separately, since it is not encoded in the URL. Ensure that the resulting key remains
-    # reasonably sized and contains only characters compatible with all relevant cache backends by using MD5 hash.
-    key = hashlib.md5(f"qr.{url}&data_uri_for_svg={use_data_uri_for_svg}".encode()).hexdigest()
+    data = _as_text(data, force_text)
+    local_key = _make_cache_key(data, qr_code_options, force_text, use_data_uri_for_svg, alt_text, class_names)
+    qr_code = _EMBEDDED_QR_CODE_CACHE.get(local_key)
+    if qr_code is not None:
+        return qr_code
+    # Hash the arguments, so that the key remains reasonably sized and contains only characters compatible with all
+    # relevant cache backends. The representation of the options is stable across processes.
+    key_source = repr((type(data), data, force_text, qr_code_options.cache_key(), use_data_uri_for_svg, alt_text, class_names))
+    key = f"qr_code.{hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()}"
     cache = caches[cache_name]
     qr_code = cache.get(key)
     if qr_code is None:
@@ -185,6 +317,8 @@ def get_or_make_cached_embedded_qr_code(
                                         use_data_uri_for_svg=use_data_uri_for_svg, alt_text=alt_text,
                                         class_names=class_names)
         cache.set(key, qr_code, timeout=cache_timeout)
+    else:
+        _EMBEDDED_QR_CODE_CACHE.set(local_key, qr_code)
     return qr_code
 
 
@@ -1,4 +1,5 @@
 import base64
+import functools
 import urllib.parse
 from collections.abc import Mapping
 from datetime import datetime
@@ -6,7 +7,9 @@ from typing import Optional, Any
 
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser, User
+from django.core.signals import setting_changed
 from django.core.signing import Signer
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.crypto import get_random_string
 from django.utils.encoding import force_str
@@ -44,23 +47,45 @@ def _options_allow_external_request(url_protection_options: Mapping, user: User
 
 
 def requires_url_protection_token(user: User | AnonymousUser | None = None) -> bool:
-    return not _options_allow_external_request(get_url_protection_options(), user)
+    return not _options_allow_external_request(_get_cached_url_protection_options(), user)
 
 
 def allows_external_request_from_user(user: User | AnonymousUser | None = None) -> bool:
-    return _options_allow_external_request(get_url_protection_options(), user)
+    return _options_allow_external_request(_get_cached_url_protection_options(), user)
 
 
-def get_url_protection_options() -> dict:
+@functools.lru_cache(maxsize=1)
+def _get_cached_url_protection_options() -> dict:
+    # Do not mutate the returned dict, it is shared by all callers.
     options = _get_default_url_protection_options()
     settings_options = _get_url_protection_settings()
     if settings_options is not None:
-        options.update(settings.QR_CODE_URL_PROTECTION)
+        options.update(settings_options)
     return options
 
 
+def get_url_protection_options() -> dict:
+    return dict(_get_cached_url_protection_options())
+
+
+@functools.lru_cache(maxsize=1)
+def get_url_protection_signer() -> Signer:
+    """Returns the signer used to sign and check the URL protection tokens."""
+    url_protection_options = _get_cached_url_protection_options()
+    return Signer(key=url_protection_options[constants.SIGNING_KEY], salt=url_protection_options[constants.SIGNING_SALT])
+
+
+@receiver(setting_changed)
+def _clear_url_protection_caches(*, setting, **kwargs) -> None:
+    if setting in ("QR_CODE_URL_PROTECTION", "SECRET_KEY"):
+        _get_cached_url_protection_options.cache_clear()
+        get_url_protection_signer.cache_clear()
+        _sign_url_protection_token.cache_clear()
+        _get_default_options_query_string.cache_clear()
+
+
 def _make_random_token() -> str:
-    url_protection_options = get_url_protection_options()
+    url_protection_options = _get_cached_url_protection_options()
     return get_random_string(url_protection_options[constants.TOKEN_LENGTH])
 
 
@@ -69,10 +94,14 @@ _RANDOM_TOKEN = _make_random_token()
 
 def get_qr_url_protection_signed_token(qr_code_options: QRCodeOptions):
     """Generate a signed token to handle view protection."""
-    url_protection_options = get_url_protection_options()
-    signer = Signer(key=url_protection_options[constants.SIGNING_KEY], salt=url_protection_options[constants.SIGNING_SALT])
-    token = signer.sign(get_qr_url_protection_token(qr_code_options, _RANDOM_TOKEN))
-    return token
+    return _sign_url_protection_token(get_qr_url_protection_token(qr_code_options, _RANDOM_TOKEN))
+
+
+@functools.lru_cache(maxsize=256)
+def _sign_url_protection_token(token: str) -> str:
+    # The token only depends on a few image attributes and on the process-wide random token, so the same handful of
+    # tokens is signed over and over on pages showing many QR codes.
+    return get_url_protection_signer().sign(token)
 
 
 def get_qr_url_protection_token(qr_code_options, random_token):
@@ -99,14 +128,69 @@ def get_qr_url_protection_token(qr_code_options, random_token):
     )
 
 
+_QR_CODE_ETAG_SUFFIX = f':version_{constants.QR_CODE_GENERATION_VERSION_DATE.isoformat()}"'
+
+
 def qr_code_etag(request) -> str:
-    return f'"{request.path}:{request.GET.urlencode()}:version_{constants.QR_CODE_GENERATION_VERSION_DATE.isoformat()}"'
+    return f'"{request.path}:{request.GET.urlencode()}{_QR_CODE_ETAG_SUFFIX}'
 
 
 def qr_code_last_modified(_request) -> datetime:
     return constants.QR_CODE_GENERATION_VERSION_DATE
 
 
+def _make_query_string(params: list[tuple[str, Any]]) -> str:
+    """Equivalent to `urllib.parse.urlencode(params)`, but skips quoting the keys, which are known to be safe, and
+    the integer values."""
+    quote_plus = urllib.parse.quote_plus
+    return "&".join(f"{key}={value}" if isinstance(value, int) else f"{key}={quote_plus(str(value))}" for key, value in params)
+
+
+def _make_options_query_string(qr_code_options: QRCodeOptions, cache_enabled_arg: int, url_signature_enabled: bool) -> str:
+    """Returns the query string arguments of a QR code URL that do not depend on the encoded data."""
+    params: list[tuple[str, Any]] = [("cache_enabled", cache_enabled_arg)]
+    # Only add non-default values to the params
+    if qr_code_options.size != constants.DEFAULT_MODULE_SIZE:
+        params.append(("size", qr_code_options.size))
+    if qr_code_options.border != constants.DEFAULT_BORDER_SIZE:
+        params.append(("border", qr_code_options.border))
+    if qr_code_options.version != constants.DEFAULT_VERSION:
+        params.append(("version", qr_code_options.version))
+    if qr_code_options.image_format != constants.DEFAULT_IMAGE_FORMAT:
+        params.append(("image_format", qr_code_options.image_format))
+    if qr_code_options.error_correction != constants.DEFAULT_ERROR_CORRECTION:
+        params.append(("error_correction", qr_code_options.error_correction))
+    if qr_code_options.micro:
+        params.append(("micro", 1))
+    if qr_code_options.eci:
+        params.append(("eci", 1))
+    if qr_code_options.boost_error:
+        params.append(("boost_error", 1))
+    params.append(("encoding", qr_code_options.encoding if qr_code_options.encoding else ""))
+    params.extend(qr_code_options.color_mapping().items())
+    if url_signature_enabled:
+        # Generate token to handle view protection. The token is added to the query arguments. It does not replace
+        # existing plain data query arguments to allow usage of the URL as an API (without a token since external
+        # users cannot generate the signed token!).
+        token = get_qr_url_protection_signed_token(qr_code_options)
+        params.append(("token", token))
+    return _make_query_string(params)
+
+
+_DEFAULT_OPTIONS_CACHE_KEY = QRCodeOptions().cache_key()
+
+
+def _has_default_url_options(qr_code_options: QRCodeOptions) -> bool:
+    # The cache key holds the numeric size, while URLs keep the size as given, hence the additional check.
+    return qr_code_options.size == constants.DEFAULT_MODULE_SIZE and qr_code_options.cache_key() == _DEFAULT_OPTIONS_CACHE_KEY
+
+
+@functools.lru_cache(maxsize=4)
+def _get_default_options_query_string(cache_enabled_arg: int, url_signature_enabled: bool) -> str:
+    """Same as `_make_options_query_string` for the default options, which most QR code URLs use."""
+    return _make_options_query_string(QRCodeOptions(), cache_enabled_arg, url_signature_enabled)
+
+
 @validate_call(config=PYDANTIC_CONFIG)
 def make_qr_code_url(
     data: Any,
@@ -129,49 +213,24 @@ def make_qr_code_url(
     :param bool url_signature_enabled: Tells whether the random token for protecting the URL against
         external requests is added to the returned URL. It defaults to *True*.
     """
-    qr_code_options = QRCodeOptions() if qr_code_options is None else qr_code_options
     if url_signature_enabled is None:
         url_signature_enabled = constants.DEFAULT_URL_SIGNATURE_ENABLED
     if cache_enabled is None:
         cache_enabled = constants.DEFAULT_CACHE_ENABLED
     cache_enabled_arg = 1 if cache_enabled else 0
+    # Base64 output is pure ASCII, so decode it with the ASCII fast path.
     if force_text:
-        encoded_data = str(base64.b64encode(force_str(data).encode("utf-8")), encoding="utf-8")
-        params = dict(text=encoded_data, cache_enabled=cache_enabled_arg)
+        data_param: tuple[str, Any] = ("text", base64.b64encode(force_str(data).encode("utf-8")).decode("ascii"))
     elif isinstance(data, int):
-        params = dict(int=data, cache_enabled=cache_enabled_arg)
+        data_param = ("int", data)
+    elif isinstance(data, str):
+        data_param = ("bytes", base64.b64encode(data.encode("utf-8")).decode("ascii"))
     else:
-        if isinstance(data, str):
-            b64data = base64.b64encode(force_str(data).encode("utf-8"))
-        else:
-            b64data = base64.b64encode(data)
-        encoded_data = str(b64data, encoding="utf-8")
-        params = dict(bytes=encoded_data, cache_enabled=cache_enabled_arg)
-    # Only add non-default values to the params dict
-    if qr_code_options.size != constants.DEFAULT_MODULE_SIZE:
-        params["size"] = qr_code_options.size
-    if qr_code_options.border != constants.DEFAULT_BORDER_SIZE:
-        params["border"] = qr_code_options.border
-    if qr_code_options.version != constants.DEFAULT_VERSION:
-        params["version"] = qr_code_options.version
-    if qr_code_options.image_format != constants.DEFAULT_IMAGE_FORMAT:
-        params["image_format"] = qr_code_options.image_format
-    if qr_code_options.error_correction != constants.DEFAULT_ERROR_CORRECTION:
-        params["error_correction"] = qr_code_options.error_correction
-    if qr_code_options.micro:
-        params["micro"] = 1
-    if qr_code_options.eci:
-        params["eci"] = 1
-    if qr_code_options.boost_error:
-        params["boost_error"] = 1
-    params["encoding"] = qr_code_options.encoding if qr_code_options.encoding else ""
-    params.update(qr_code_options.color_mapping())
+        data_param = ("bytes", base64.b64encode(data).decode("ascii"))
+    if qr_code_options is None or _has_default_url_options(qr_code_options):
+        options_query = _get_default_options_query_string(cache_enabled_arg, url_signature_enabled)
+    else:
+        options_query = _make_options_query_string(qr_code_options, cache_enabled_arg, url_signature_enabled)
     path = reverse("qr_code:serve_qr_code_image")
-    if url_signature_enabled:
-        # Generate token to handle view protection. The token is added to the query arguments. It does not replace
-        # existing plain data query arguments to allow usage of the URL as an API (without a token since external
-        # users cannot generate the signed token!).
-        token = get_qr_url_protection_signed_token(qr_code_options)
-        params["token"] = token
-    url = f"{path}?{urllib.parse.urlencode(params)}"
+    url = f"{path}?{_make_query_string([data_param])}&{options_query}"
     return mark_safe(url)
@@ -146,18 +146,13 @@ class QRCodeOptions:
         :raises: TypeError in case an unknown argument is given.
         """
         self._size = size
+        self._size_number = _normalize_size(size)
         self._border = int(border)
-        if _can_be_cast_to_int(version):
-            version = int(version)  # type: ignore
-            if not 1 <= version <= 40:
-                version = None
-        elif version in ("m1", "m2", "m3", "m4", "M1", "M2", "M3", "M4"):
-            version = version.lower()  # type: ignore
+        version = _normalize_version(version)
+        if isinstance(version, str):
             # Set / change the micro setting otherwise Segno complains about
             # conflicting parameters
             micro = True
-        else:
-            version = None
         self._version = version
         # if not isinstance(micro, bool):
         #     micro = micro == 'True'
@@ -238,25 +233,30 @@ class QRCodeOptions:
         colors = {k: v for k, v in self._colors.items() if v is not False}
         return colors
 
+    def cache_key(self) -> tuple:
+        """Internal method which returns a hashable representation of the options, suitable as a cache key.
+
+        :rtype: tuple
+        """
+        return (
+            self._size_number,
+            self._border,
+            self._version,
+            self._image_format,
+            self._error_correction,
+            self._encoding,
+            self._boost_error,
+            self._micro,
+            self._eci,
+            tuple(self._colors.items()),
+        )
+
     def _size_as_number(self) -> Union[int, float, str, Decimal]:
         """Returns the size as integer value.
 
         :rtype: int or float
         """
-        size = self._size
-        if _can_be_cast_to_int(size):
-            actual_size = int(size)  # type: ignore
-            if actual_size < 1:
-                actual_size = SIZE_DICT[DEFAULT_MODULE_SIZE]
-        elif isinstance(size, (float, Decimal)):
-            actual_size = size  # type: ignore
-            if actual_size < Decimal("0.01"):
-                actual_size = SIZE_DICT[DEFAULT_MODULE_SIZE]
-        elif isinstance(size, str):
-            actual_size = SIZE_DICT.get(size.lower(), DEFAULT_MODULE_SIZE)
-        else:
-            actual_size = SIZE_DICT[DEFAULT_MODULE_SIZE]
-        return actual_size
+        return self._size_number
 
     @property
     def size(self):
@@ -295,8 +295,28 @@ class QRCodeOptions:
         return self._eci
 
 
-def _can_be_cast_to_int(value: Any) -> bool:
-    return isinstance(value, int) or (isinstance(value, str) and value.isdigit())
+_SIZE_LOOKUP: dict = {**SIZE_DICT, **{k.upper(): v for k, v in SIZE_DICT.items()}}
+_MICRO_VERSION_LOOKUP: dict = {v: v.lower() for v in ("m1", "m2", "m3", "m4", "M1", "M2", "M3", "M4")}
+
+
+def _normalize_size(size: Any) -> Union[int, float, Decimal]:
+    """Returns the size of a module as a positive number. Invalid sizes fall back to the default size."""
+    if isinstance(size, (float, Decimal)):
+        return size if size >= Decimal("0.01") else SIZE_DICT[DEFAULT_MODULE_SIZE]
+    try:
+        actual_size = int(size)
+    except (TypeError, ValueError):
+        return _SIZE_LOOKUP.get(size, SIZE_DICT[DEFAULT_MODULE_SIZE])
+    return actual_size if actual_size >= 1 else SIZE_DICT[DEFAULT_MODULE_SIZE]
+
+
+def _normalize_version(version: Any) -> Union[int, str, None]:
+    """Returns the version as an integer between 1 and 40, a lower case Micro QR code version, or None if invalid."""
+    try:
+        actual_version = int(version)
+    except (TypeError, ValueError):
+        return _MICRO_VERSION_LOOKUP.get(version)
+    return actual_version if 1 <= actual_version <= 40 else None
 
 
 class EventClass(Enum):
@@ -560,39 +580,34 @@ class ContactDetail:
 
         # See this for an archive of the format specifications:
         # https://web.archive.org/web/20160304025131/https://www.nttdocomo.co.jp/english/service/developer/make/content/barcode/function/application/addressbook/index.html
-        contact_text = "MECARD:"
-        for name_components_pair in (
-            ("N:%s;", (_escape_mecard_special_chars(self.last_name), _escape_mecard_special_chars(self.first_name))),
-            ("SOUND:%s;", (_escape_mecard_special_chars(self.last_name_reading), _escape_mecard_special_chars(self.first_name_reading))),
+        parts = ["MECARD:"]
+        for field_name, name_components in (
+            ("N", (_escape_mecard_special_chars(self.last_name), _escape_mecard_special_chars(self.first_name))),
+            ("SOUND", (_escape_mecard_special_chars(self.last_name_reading), _escape_mecard_special_chars(self.first_name_reading))),
         ):
-            if name_components_pair[1][0] and name_components_pair[1][1]:
-                name = "%s,%s" % name_components_pair[1]
+            if name_components[0] and name_components[1]:
+                name = f"{name_components[0]},{name_components[1]}"
             else:
-                name = name_components_pair[1][0] or name_components_pair[1][1] or ""
+                name = name_components[0] or name_components[1] or ""
             if name:
-                contact_text += name_components_pair[0] % name
-        if self.tel:
-            contact_text += "TEL:%s;" % _escape_mecard_special_chars(self.tel)
-        if self.tel_av:
-            contact_text += "TEL-AV:%s;" % _escape_mecard_special_chars(self.tel_av)
-        if self.email:
-            contact_text += "EMAIL:%s;" % _escape_mecard_special_chars(self.email)
-        if self.memo:
-            contact_text += "NOTE:%s;" % _escape_mecard_special_chars(self.memo)
-        if self.birthday:
-            # Format date to YYMMDD.
-            contact_text += "BDAY:%s;" % self.birthday.strftime("%Y%m%d")
-        if self.address:
-            contact_text += "ADR:%s;" % self.address
-        if self.url:
-            contact_text += "URL:%s;" % _escape_mecard_special_chars(self.url)
-        if self.nickname:
-            contact_text += "NICKNAME:%s;" % _escape_mecard_special_chars(self.nickname)
-        # Not standard, but recognized by several readers.
-        if self.org:
-            contact_text += "ORG:%s;" % _escape_mecard_special_chars(self.org)
-        contact_text += ";"
-        return contact_text
+                parts.append(f"{field_name}:{name};")
+        for field_name, value, needs_escaping in (
+            ("TEL", self.tel, True),
+            ("TEL-AV", self.tel_av, True),
+            ("EMAIL", self.email, True),
+            ("NOTE", self.memo, True),
+            # Format date to YYYYMMDD.
+            ("BDAY", self.birthday and f"{self.birthday.year:04d}{self.birthday.month:02d}{self.birthday.day:02d}", False),
+            ("ADR", self.address, False),
+            ("URL", self.url, True),
+            ("NICKNAME", self.nickname, True),
+            # Not standard, but recognized by several readers.
+            ("ORG", self.org, True),
+        ):
+            if value:
+                parts.append(f"{field_name}:{_escape_mecard_special_chars(value) if needs_escaping else value};")
+        parts.append(";")
+        return "".join(parts)
 
     def escaped_value(self, field_name: str):
         return _escape_mecard_special_chars(getattr(self, field_name))
@@ -769,17 +784,17 @@ class WifiConfig:
         :rtype: str
         """
 
-        wifi_config = "WIFI:"
+        parts = ["WIFI:"]
         if self.ssid:
-            wifi_config += "S:%s;" % _escape_mecard_special_chars(self.ssid)
+            parts.append(f"S:{_escape_mecard_special_chars(self.ssid)};")
         if self.authentication:
-            wifi_config += "T:%s;" % WifiConfig.AUTHENTICATION_CHOICES[self.authentication][1]
+            parts.append(f"T:{WifiConfig.AUTHENTICATION_CHOICES[self.authentication][1]};")
         if self.password:
-            wifi_config += "P:%s;" % _escape_mecard_special_chars(self.password)
+            parts.append(f"P:{_escape_mecard_special_chars(self.password)};")
         if self.hidden:
-            wifi_config += "H:%s;" % str(self.hidden).lower()
-        wifi_config += ";"
-        return wifi_config
+            parts.append(f"H:{str(self.hidden).lower()};")
+        parts.append(";")
+        return "".join(parts)
 
 
 @pydantic_dataclass
@@ -862,11 +877,11 @@ class Email:
         return helpers.make_make_email_data(**asdict(self))
 
 
+_MECARD_ESCAPE_TABLE = str.maketrans({sc: f"\\{sc}" for sc in ("\\", '"', ";", ",", ":")})
+
+
 @validate_call
 def _escape_mecard_special_chars(string_to_escape: Optional[str]) -> Optional[str]:
     if not string_to_escape:
         return string_to_escape
-    special_chars = ["\\", '"', ";", ",", ":"]
-    for sc in special_chars:
-        string_to_escape = string_to_escape.replace(sc, "\\%s" % sc)
-    return string_to_escape
+    return string_to_escape.translate(_MECARD_ESCAPE_TABLE)
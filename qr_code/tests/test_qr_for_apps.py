@@ -235,6 +235,10 @@ class TestWifiConfig(SimpleTestCase):
         self.assertEqual(wifi1.make_qr_code_data(), "WIFI:S:my-wifi;T:WPA;P:wifi-password;;")
         self.assertEqual(wifi2.make_qr_code_data(), "WIFI:S:my-wifi;T:WPA;P:wifi-password;H:true;;")
 
+    def test_make_qr_code_text_with_special_chars(self):
+        wifi = WifiConfig(ssid='my "wifi"', authentication=WifiConfig.AUTHENTICATION.WPA, password="a\\b;c,d:e")
+        self.assertEqual(wifi.make_qr_code_data(), r'WIFI:S:my \"wifi\";T:WPA;P:a\\b\;c\,d\:e;;')
+
 
 class TestCoordinates(SimpleTestCase):
     def test_coordinates(self):
@@ -1,8 +1,10 @@
 """Tests for qr_code application."""
 import os
+import urllib.parse
 from decimal import Decimal
+from unittest import mock
 
-from django.test import SimpleTestCase
+from django.test import RequestFactory, SimpleTestCase, override_settings
 from pydantic import ValidationError
 
 from qr_code.qrcode.constants import (
@@ -13,8 +15,12 @@ from qr_code.qrcode.constants import (
     DEFAULT_ECI,
     DEFAULT_BOOST_ERROR,
     DEFAULT_ENCODING,
+    SIGNING_SALT,
+    QR_CODE_GENERATION_VERSION_DATE,
 )
-from qr_code.qrcode.serve import make_qr_code_url
+from qr_code.qrcode import maker
+from qr_code.qrcode.serve import make_qr_code_url, get_url_protection_options, get_url_protection_signer, _make_query_string
+from qr_code.qrcode.serve import get_qr_url_protection_signed_token, _RANDOM_TOKEN, _make_options_query_string, qr_code_etag
 from qr_code.qrcode.utils import QRCodeOptions
 from qr_code.tests import TEST_TEXT, PNG_REF_SUFFIX, SVG_REF_SUFFIX
 
@@ -45,6 +51,23 @@ class TestQRCodeOptions(SimpleTestCase):
         options = QRCodeOptions(image_format="invalid-image-format")
         self.assertEqual(options.image_format, DEFAULT_IMAGE_FORMAT)
 
+    def test_size_normalization(self):
+        self.assertEqual(QRCodeOptions(size="L")._size_as_number(), 30)
+        self.assertEqual(QRCodeOptions(size="l")._size_as_number(), 30)
+        self.assertEqual(QRCodeOptions(size="7")._size_as_number(), 7)
+        self.assertEqual(QRCodeOptions(size=Decimal("1.5"))._size_as_number(), Decimal("1.5"))
+        for invalid_size in ("invalid", 0, -2, "-2", 0.001, None):
+            self.assertEqual(QRCodeOptions(size=invalid_size)._size_as_number(), 18)
+
+    def test_version_normalization(self):
+        self.assertEqual(QRCodeOptions(version=12).version, 12)
+        self.assertEqual(QRCodeOptions(version="40").version, 40)
+        options = QRCodeOptions(version="M3")
+        self.assertEqual(options.version, "m3")
+        self.assertTrue(options.micro)
+        for invalid_version in (0, 41, "m5", "invalid", None):
+            self.assertIsNone(QRCodeOptions(version=invalid_version).version)
+
     def test_kw_save(self):
         options = QRCodeOptions(border=0, image_format="png", size=13)
         self.assertDictEqual(options.kw_save(), {"border": 0, "dark": "black", "kind": "png", "light": "white", "scale": 13})
@@ -70,3 +93,134 @@ class TestWriteResourceData(SimpleTestCase):
         write_png_content_to_file(TestWriteResourceData.resource_file_base_name, image_data)
         file_path_to_remove = os.path.join(get_resources_path(), TestWriteResourceData.resource_file_base_name + PNG_REF_SUFFIX)
         os.remove(file_path_to_remove)
+
+
+class TestUrlProtectionOptions(SimpleTestCase):
+    def test_signer_is_shared(self):
+        self.assertIs(get_url_protection_signer(), get_url_protection_signer())
+
+    def test_signed_token_is_reused(self):
+        token = get_qr_url_protection_signed_token(QRCodeOptions(size=8))
+        self.assertEqual(get_qr_url_protection_signed_token(QRCodeOptions(size=8)), token)
+        self.assertNotEqual(get_qr_url_protection_signed_token(QRCodeOptions(size=9)), token)
+
+    def test_settings_change_is_taken_into_account(self):
+        signer = get_url_protection_signer()
+        with self.settings(QR_CODE_URL_PROTECTION={SIGNING_SALT: "other-salt"}):
+            self.assertEqual(get_url_protection_options()[SIGNING_SALT], "other-salt")
+            self.assertIsNot(get_url_protection_signer(), signer)
+            self.assertEqual(get_url_protection_signer().salt, "other-salt")
+            token = get_qr_url_protection_signed_token(QRCodeOptions())
+            self.assertTrue(get_url_protection_signer().unsign(token).endswith(_RANDOM_TOKEN))
+        self.assertNotEqual(get_url_protection_options()[SIGNING_SALT], "other-salt")
+
+
+class TestQueryString(SimpleTestCase):
+    def test_make_query_string_matches_urlencode(self):
+        params = [
+            ("text", "SGVsbG8gV29ybGQh+/=="),
+            ("cache_enabled", 1),
+            ("size", Decimal("1.5")),
+            ("micro", True),
+            ("encoding", ""),
+            ("dark_color", "#ff0000"),
+            ("light_color", (255, 255, 255)),
+            ("token", "1.4.svg:abc-_"),
+        ]
+        self.assertEqual(_make_query_string(params), urllib.parse.urlencode(params))
+
+    def test_default_options_query_string(self):
+        url = make_qr_code_url(TEST_TEXT)
+        self.assertEqual(make_qr_code_url(TEST_TEXT, QRCodeOptions()), url)
+        self.assertTrue(url.endswith("&" + _make_options_query_string(QRCodeOptions(), 1, True)))
+        self.assertIn("&size=M&", make_qr_code_url(TEST_TEXT, QRCodeOptions(size="M")))
+        self.assertIn("&size=18&", make_qr_code_url(TEST_TEXT, QRCodeOptions(size=18)))
+        self.assertNotIn("token=", make_qr_code_url(TEST_TEXT, url_signature_enabled=False))
+
+
+class TestQRCodeEtag(SimpleTestCase):
+    def test_etag(self):
+        request = RequestFactory().get("/qr-code-image/", {"text": "SGVsbG8=", "size": 8})
+        self.assertEqual(
+            qr_code_etag(request), f'"/qr-code-image/:text=SGVsbG8%3D&size=8:version_{QR_CODE_GENERATION_VERSION_DATE.isoformat()}"'
+        )
+
+
+class TestInProcessCaches(SimpleTestCase):
+    def setUp(self):
+        maker._QR_IMAGE_CACHE.clear()
+        maker._EMBEDDED_QR_CODE_CACHE.clear()
+
+    def tearDown(self):
+        maker._QR_IMAGE_CACHE.clear()
+        maker._EMBEDDED_QR_CODE_CACHE.clear()
+
+    def test_image_is_generated_once(self):
+        with mock.patch("qr_code.qrcode.maker.make_qr", wraps=maker.make_qr) as make_qr_mock:
+            image1 = maker.make_qr_code_image(TEST_TEXT, QRCodeOptions(image_format="png"))
+            image2 = maker.make_qr_code_image(TEST_TEXT, QRCodeOptions(image_format="png"))
+            image3 = maker.make_qr_code_image(TEST_TEXT, QRCodeOptions(image_format="svg"))
+        self.assertEqual(image1, image2)
+        self.assertNotEqual(image1, image3)
+        self.assertEqual(make_qr_mock.call_count, 2)
+
+    @override_settings(QR_CODE_IMAGE_CACHE_SIZE=1)
+    def test_least_recently_used_image_is_evicted(self):
+        with mock.patch("qr_code.qrcode.maker.make_qr", wraps=maker.make_qr) as make_qr_mock:
+            maker.make_qr_code_image(TEST_TEXT, QRCodeOptions())
+            maker.make_qr_code_image("Other text", QRCodeOptions())
+            maker.make_qr_code_image(TEST_TEXT, QRCodeOptions())
+        self.assertEqual(make_qr_mock.call_count, 3)
+
+    @override_settings(QR_CODE_IMAGE_CACHE_SIZE=0)
+    def test_cache_can_be_disabled(self):
+        with mock.patch("qr_code.qrcode.maker.make_qr", wraps=maker.make_qr) as make_qr_mock:
+            maker.make_qr_code_image(TEST_TEXT, QRCodeOptions())
+            maker.make_qr_code_image(TEST_TEXT, QRCodeOptions())
+        self.assertEqual(make_qr_mock.call_count, 2)
+
+    def test_embedded_qr_code_is_generated_once(self):
+        with mock.patch("qr_code.qrcode.maker.make_qr", wraps=maker.make_qr) as make_qr_mock:
+            qr1 = maker.make_embedded_qr_code(TEST_TEXT, QRCodeOptions(image_format="png"))
+            qr2 = maker.make_embedded_qr_code(TEST_TEXT, QRCodeOptions(image_format="png"))
+            qr3 = maker.make_embedded_qr_code(TEST_TEXT, QRCodeOptions(image_format="png"), alt_text="alternative text")
+        self.assertEqual(qr1, qr2)
+        self.assertNotEqual(qr1, qr3)
+        self.assertEqual(make_qr_mock.call_count, 2)
+
+    @override_settings(QR_CODE_EMBED_CACHE_SIZE=0)
+    def test_embedded_qr_code_cache_can_be_disabled(self):
+        with mock.patch("qr_code.qrcode.maker.make_qr", wraps=maker.make_qr) as make_qr_mock:
+            maker.make_embedded_qr_code(TEST_TEXT, QRCodeOptions())
+            maker.make_embedded_qr_code(TEST_TEXT, QRCodeOptions())
+        self.assertEqual(make_qr_mock.call_count, 2)
+
+    def test_data_is_converted_to_text_once(self):
+        class Text:
+            conversion_count = 0
+
+            def __str__(self):
+                Text.conversion_count += 1
+                return TEST_TEXT
+
+        maker.make_embedded_qr_code(Text(), QRCodeOptions(image_format="png"))
+        self.assertEqual(Text.conversion_count, 1)
+
+    @override_settings(QR_CODE_IMAGE_CACHE_SIZE=0)
+    def test_reused_stream_does_not_leak_previous_image(self):
+        options = QRCodeOptions(image_format="png")
+        expected_image = maker.make_qr_code_image(TEST_TEXT, options)
+        maker.make_qr_code_image(TEST_TEXT * 20, QRCodeOptions(image_format="png", size="h"))
+        self.assertEqual(maker.make_qr_code_image(TEST_TEXT, options), expected_image)
+
+    def test_django_cache_is_shared_across_processes(self):
+        options = QRCodeOptions(image_format="png")
+        qr1 = maker.get_or_make_cached_embedded_qr_code(TEST_TEXT, options, alt_text="first")
+        # Simulate another process: the in-process cache is empty, but the Django cache is not.
+        maker._EMBEDDED_QR_CODE_CACHE.clear()
+        with mock.patch("qr_code.qrcode.maker.make_qr", wraps=maker.make_qr) as make_qr_mock:
+            qr2 = maker.get_or_make_cached_embedded_qr_code(TEST_TEXT, options, alt_text="first")
+            qr3 = maker.get_or_make_cached_embedded_qr_code(TEST_TEXT, options, alt_text="second")
+        self.assertEqual(qr1, qr2)
+        self.assertIn('alt="second"', qr3)
+        self.assertEqual(make_qr_mock.call_count, 1)